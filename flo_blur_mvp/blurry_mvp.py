@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
-import os
 import csv
 import time
-import math
+import atexit
+import queue
+import threading
 import signal
+import sys
 import argparse
 import tkinter as tk
+from bisect import bisect_right
+from collections import deque
+from heapq import heappop, heappush
+from itertools import count
+from concurrent.futures import Future
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone, time as dtime
-from typing import Dict, Optional, List, Tuple
+from typing import Callable, Deque, Dict, Mapping, Optional, List, Sequence, Set, Tuple
 
 from simulator import Simulator
 
@@ -20,23 +27,70 @@ DEFAULT_AGG_SUPPRESS_SEC = 5 * 60
 DEFAULT_SITE_ID = "Default"
 
 
-@dataclass
+def _camera_label(camera_id: str) -> str:
+    return camera_id.rsplit("-", 1)[-1]
+
+
+def _line_display(line_number: Optional[int]) -> str:
+    return str(line_number) if line_number and line_number > 0 else "?"
+
+
+def _second_of_day(value: dtime) -> int:
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _compile_washdown(schedule: List[Tuple[dtime, dtime]]) -> Tuple[List[int], List[int]]:
+    intervals: List[Tuple[int, int]] = []
+    for start, end in schedule:
+        start_sec, end_sec = _second_of_day(start), _second_of_day(end)
+        if start_sec <= end_sec:
+            intervals.append((start_sec, end_sec))
+        else:
+            intervals.append((start_sec, 86399))
+            intervals.append((0, end_sec))
+    intervals.sort()
+    starts: List[int] = []
+    ends: List[int] = []
+    for start_sec, end_sec in intervals:
+        if ends and start_sec <= ends[-1]:
+            ends[-1] = max(ends[-1], end_sec)
+        else:
+            starts.append(start_sec)
+            ends.append(end_sec)
+    return starts, ends
+
+
+@dataclass(slots=True)
 class Event:
     ts: datetime
     camera_id: str
     is_blurry: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertCandidate:
     camera_id: str
     line_number: Optional[int]
     blur_since: datetime
     ready_at: datetime
     site_id: str
-
-
-@dataclass
+    camera_label: str = ""
+    line_display: str = ""
+    blur_since_s: Optional[float] = None
+    ready_at_s: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if not self.camera_label:
+            self.camera_label = _camera_label(self.camera_id)
+        if not self.line_display:
+            self.line_display = _line_display(self.line_number)
+        if self.blur_since_s is None:
+            self.blur_since_s = self.blur_since.timestamp()
+        if self.ready_at_s is None:
+            self.ready_at_s = self.ready_at.timestamp()
+
+
+@dataclass(slots=True)
 class AlertAction:
     kind: str  # "single" or "aggregate"
     candidates: List[AlertCandidate]
@@ -44,40 +98,142 @@ class AlertAction:
     washdown_hint: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraAlertState:
     is_blurry: bool = False
     blur_start: Optional[datetime] = None
     last_alert_until: Optional[datetime] = None
     alert_open: bool = False
     pending_candidate: bool = False
+    blur_start_s: Optional[float] = None
+    last_alert_until_s: Optional[float] = None
 
+    def __post_init__(self) -> None:
+        if self.blur_start_s is None and self.blur_start is not None:
+            self.blur_start_s = self.blur_start.timestamp()
+        if self.last_alert_until_s is None and self.last_alert_until is not None:
+            self.last_alert_until_s = self.last_alert_until.timestamp()
 
-class CsvStore:
-    def __init__(self, path: str):
-        self.path = path
-        if not os.path.exists(self.path):
-            with open(self.path, "w", newline="") as f:
-                csv.writer(f).writerow(["ts_iso", "camera_id", "is_blurry"])
 
-    def append(self, event: Event) -> None:
-        with open(self.path, "a", newline="") as f:
-            csv.writer(f).writerow([event.ts.isoformat(), event.camera_id, int(event.is_blurry)])
+_CLOSE = object()
 
 
-class BlurEpisodeStore:
-    def __init__(self, path: str):
+class _CsvAppender:
+    def __init__(self, path: str, header: List[str], batch_size: int = 512, max_pending: int = 10_000):
         self.path = path
-        if not os.path.exists(self.path):
-            with open(self.path, "w", newline="") as f:
-                csv.writer(f).writerow(["camera_id", "blur_start_iso", "cleared_iso"])
+        self.batch_size = max(1, batch_size)
+        self._header = header
+        self._f = open(self.path, "a", newline="", buffering=1 << 16)
+        self._writer = csv.writer(self._f)
+        # The header goes out with the first batch so a new file costs a single write.
+        self._need_header = self._f.tell() == 0
+        self._closed = False
+        self._error: Optional[Exception] = None
+        self._q: "queue.Queue[object]" = queue.Queue(maxsize=max(1, max_pending))
+        self._thread = threading.Thread(target=self._drain, name=f"csv-writer:{path}", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _check_writable(self) -> None:
+        if self._closed:
+            raise ValueError("I/O operation on closed store")
+        self._raise_if_failed()
+
+    def _push(self, line: str) -> None:
+        self._check_writable()
+        self._q.put([line])
+
+    def _push_many(self, lines: List[str]) -> None:
+        self._check_writable()
+        if lines:
+            self._q.put(lines)
+
+    def _drain(self) -> None:
+        while True:
+            item = self._q.get()
+            taken = 1
+            closing = item is _CLOSE
+            # Producers hand over freshly built lists, so the first one is extended in place.
+            lines: List[str] = [] if closing else item
+            while not closing and len(lines) < self.batch_size:
+                try:
+                    item = self._q.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is _CLOSE:
+                    closing = True
+                else:
+                    lines.extend(item)
+            # After a failed write the writer keeps draining (and discarding) so producers never
+            # block on it; the stored error is raised on the producer side instead.
+            if self._error is None:
+                try:
+                    if self._need_header:
+                        self._writer.writerow(self._header)
+                        self._need_header = False
+                    if lines:
+                        self._f.write("".join(lines))
+                    self._f.flush()
+                except Exception as exc:
+                    self._error = exc
+            for _ in range(taken):
+                self._q.task_done()
+            if closing:
+                return
+
+    def flush(self) -> None:
+        self._raise_if_failed()
+        self._q.join()
+        self._raise_if_failed()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._q.put(_CLOSE)
+        self._thread.join()
+        atexit.unregister(self.close)
+        try:
+            self._f.close()
+        except OSError:
+            if self._error is None:
+                raise
+        self._raise_if_failed()
+
+
+class CsvStore(_CsvAppender):
+    def __init__(self, path: str, batch_size: int = 512, max_pending: int = 10_000):
+        super().__init__(path, ["ts_iso", "camera_id", "is_blurry"], batch_size=batch_size, max_pending=max_pending)
+
+    def append(self, event: Event, ts_iso: Optional[str] = None) -> None:
+        if ts_iso is None:
+            ts_iso = event.ts.isoformat()
+        self._push(f"{ts_iso},{event.camera_id},{1 if event.is_blurry else 0}\r\n")
+
+    def append_many(self, ts_iso: str, states: Mapping[str, bool]) -> None:
+        self._push_many(
+            [f"{ts_iso},{camera_id},{1 if is_blurry else 0}\r\n" for camera_id, is_blurry in states.items()]
+        )
+
+
+class BlurEpisodeStore(_CsvAppender):
+    def __init__(self, path: str, batch_size: int = 512, max_pending: int = 10_000):
+        super().__init__(
+            path, ["camera_id", "blur_start_iso", "cleared_iso"], batch_size=batch_size, max_pending=max_pending
+        )
 
     def append(self, camera_id: str, start: datetime, end: datetime) -> None:
-        with open(self.path, "a", newline="") as f:
-            csv.writer(f).writerow([camera_id, start.isoformat(), end.isoformat()])
+        self._push(f"{camera_id},{start.isoformat()},{end.isoformat()}\r\n")
 
 
 class GuiNotifier:
+    # run() uses the *_async methods and pump(); the blocking alert_single/alert_aggregate
+    # are kept for callers that want a modal dialog.
     def __init__(self):
         self.root = tk.Tk()
         self.root.withdraw()
@@ -87,56 +243,109 @@ class GuiNotifier:
         camera_label: str,
         line_number: Optional[int],
         blur_since: Optional[datetime],
+    ) -> str:
+        message = self._single_message(camera_label, line_number, blur_since)
+        return self._show_dialog(message, clean_label="Clean Lens")
+
+    def alert_single_async(
+        self,
+        camera_label: str,
+        line_number: Optional[int],
+        blur_since: Optional[datetime],
+    ) -> "Future[Tuple[str, datetime]]":
+        message = self._single_message(camera_label, line_number, blur_since)
+        return self._post_dialog(message, clean_label="Clean Lens")
+
+    def alert_aggregate(
+        self,
+        site_id: str,
+        candidates: List[AlertCandidate],
+        washdown_hint: bool = False,
+    ) -> str:
+        message = self._aggregate_message(site_id, candidates, washdown_hint)
+        return self._show_dialog(message, clean_label="Clean Lenses")
+
+    def alert_aggregate_async(
+        self,
+        site_id: str,
+        candidates: List[AlertCandidate],
+        washdown_hint: bool = False,
+    ) -> "Future[Tuple[str, datetime]]":
+        message = self._aggregate_message(site_id, candidates, washdown_hint)
+        return self._post_dialog(message, clean_label="Clean Lenses")
+
+    def pump(self) -> None:
+        self.root.update_idletasks()
+        self.root.update()
+
+    def _single_message(
+        self,
+        camera_label: str,
+        line_number: Optional[int],
+        blur_since: Optional[datetime],
     ) -> str:
         local_since = (blur_since or datetime.now(timezone.utc)).astimezone()
         time_label = local_since.strftime("%I:%M %p")
-        line_display = str(line_number) if line_number and line_number > 0 else "?"
-        message = (
+        line_display = _line_display(line_number)
+        return (
             "FloVision Alert:\n"
             f" Camera #{camera_label} (Line {line_display}) blurry since {time_label}.\n"
             "Action: Please wipe lens."
         )
-        return self._show_dialog(message, clean_label="Clean Lens")
 
-    def alert_aggregate(
+    def _aggregate_message(
         self,
         site_id: str,
         candidates: List[AlertCandidate],
-        washdown_hint: bool = False,
+        washdown_hint: bool,
     ) -> str:
-        lines = []
-        for cand in candidates:
-            local_since = cand.blur_since.astimezone()
-            time_label = local_since.strftime("%I:%M %p")
-            line_label = cand.camera_id.split("-")[-1] if "-" in cand.camera_id else cand.camera_id
-            line_display = str(cand.line_number) if cand.line_number and cand.line_number > 0 else "?"
-            lines.append(
-                f" • Camera #{line_label} (Line {line_display}) blurry since {time_label}."
-            )
+        time_labels: Dict[datetime, str] = {}
+        lines: List[str] = [""] * len(candidates)
+        for i, cand in enumerate(candidates):
+            minute = cand.blur_since.replace(second=0, microsecond=0)
+            time_label = time_labels.get(minute)
+            if time_label is None:
+                time_label = time_labels[minute] = minute.astimezone().strftime("%I:%M %p")
+            lines[i] = f" • Camera #{cand.camera_label} (Line {cand.line_display}) blurry since {time_label}."
+        camera_lines = "\n".join(lines)
         message = (
             f"FloVision Alert (Site {site_id}):\n"
             f" {len(candidates)} cameras blurry.\n"
-            f"{os.linesep.join(lines)}\n"
+            f"{camera_lines}\n"
             "Action: Please wipe lenses."
         )
         if washdown_hint:
             message += "\n(Likely washdown window.)"
-        return self._show_dialog(message, clean_label="Clean Lenses")
+        return message
 
     def _show_dialog(self, message: str, clean_label: str) -> str:
         result = {"action": "ignore"}
+        top = self._build_dialog(message, clean_label, lambda action: result.update(action=action))
+        top.grab_set()
+        self.root.wait_window(top)
+        return result["action"]
+
+    def _post_dialog(self, message: str, clean_label: str) -> "Future[Tuple[str, datetime]]":
+        future: "Future[Tuple[str, datetime]]" = Future()
+        future.set_running_or_notify_cancel()
+        # The click time goes with the decision; it is only read at the next tick.
+        self._build_dialog(
+            message, clean_label, lambda action: future.set_result((action, datetime.now(timezone.utc)))
+        )
+        return future
 
+    def _build_dialog(self, message: str, clean_label: str, on_result: Callable[[str], object]) -> tk.Toplevel:
         top = tk.Toplevel(self.root)
         top.title("FloVision Alert")
         top.resizable(False, False)
         top.attributes("-topmost", True)
 
         def on_clean():
-            result["action"] = "clean"
+            on_result("clean")
             top.destroy()
 
         def on_ignore():
-            result["action"] = "ignore"
+            on_result("ignore")
             top.destroy()
 
         top.protocol("WM_DELETE_WINDOW", on_ignore)
@@ -155,9 +364,7 @@ class GuiNotifier:
 
         clean_btn.focus_set()
         top.lift()
-        top.grab_set()
-        self.root.wait_window(top)
-        return result["action"]
+        return top
 
 
 class SiteAlertAggregator:
@@ -171,75 +378,120 @@ class SiteAlertAggregator:
         self.window = timedelta(seconds=max(1, window_sec))
         self.min_count = max(1, min_count)
         self.suppress = timedelta(seconds=max(1, suppress_sec))
+        self.window_s = self.window.total_seconds()
+        self.suppress_s = self.suppress.total_seconds()
         self.washdown_schedule = washdown_schedule or []
+        self._washdown_starts, self._washdown_ends = _compile_washdown(self.washdown_schedule)
         self._pending_by_camera: Dict[str, AlertCandidate] = {}
-        self._pending_by_site: Dict[str, Dict[str, AlertCandidate]] = {}
-        self._site_cooldown: Dict[str, datetime] = {}
+        # Per-site slots, indexed by site position. Each pool keeps candidates in ready_at order,
+        # so expiry usually pops the left end, and a pool is reused once its site drains.
+        self._site_index: Dict[str, int] = {}
+        self._site_ids: List[str] = []
+        self._pending_by_site: List[Deque[AlertCandidate]] = []
+        self._site_cooldown: List[float] = []
+        # (ready_at_s + window_s, seq, site_idx, candidate); cancelled or aggregated entries are skipped lazily.
+        self._expiry_heap: List[Tuple[float, int, int, AlertCandidate]] = []
+        self._cooldown_heap: List[Tuple[float, int]] = []
+        self._dirty_sites: Set[int] = set()
+        self._seq = count()
+
+    def _site_slot(self, site_id: str) -> int:
+        idx = self._site_index.get(site_id)
+        if idx is None:
+            idx = self._site_index[site_id] = len(self._site_ids)
+            self._site_ids.append(site_id)
+            self._pending_by_site.append(deque())
+            self._site_cooldown.append(float("-inf"))
+        return idx
 
     def enqueue(self, candidate: AlertCandidate) -> None:
+        if candidate.camera_id in self._pending_by_camera:
+            self.cancel(candidate.camera_id)
+        site_idx = self._site_slot(candidate.site_id)
         self._pending_by_camera[candidate.camera_id] = candidate
-        site_pool = self._pending_by_site.setdefault(candidate.site_id, {})
-        site_pool[candidate.camera_id] = candidate
+        self._pending_by_site[site_idx].append(candidate)
+        heappush(self._expiry_heap, (candidate.ready_at_s + self.window_s, next(self._seq), site_idx, candidate))
+        self._dirty_sites.add(site_idx)
 
     def cancel(self, camera_id: str) -> None:
         candidate = self._pending_by_camera.pop(camera_id, None)
         if not candidate:
             return
-        site_pool = self._pending_by_site.get(candidate.site_id)
-        if site_pool is not None:
-            site_pool.pop(camera_id, None)
-            if not site_pool:
-                self._pending_by_site.pop(candidate.site_id, None)
+        self._pending_by_site[self._site_index[candidate.site_id]].remove(candidate)
 
-    def process(self, now: datetime) -> List[AlertAction]:
+    def process(self, now: datetime, now_s: Optional[float] = None) -> List[AlertAction]:
+        if now_s is None:
+            now_s = now.timestamp()
         dispatches: List[AlertAction] = []
-
-        for site_id, site_pool in list(self._pending_by_site.items()):
-            active = [cand for cand in site_pool.values() if now - cand.ready_at <= self.window]
-            if len(active) >= self.min_count:
-                cooldown = self._site_cooldown.get(site_id)
-                if not cooldown or now >= cooldown:
-                    dispatches.append(
-                        AlertAction(
-                            kind="aggregate",
-                            candidates=active,
-                            site_id=site_id,
-                            washdown_hint=self._within_washdown(active),
-                        )
-                    )
-                    for cand in active:
-                        self._pending_by_camera.pop(cand.camera_id, None)
-                        site_pool.pop(cand.camera_id, None)
-                    self._site_cooldown[site_id] = now + self.suppress
-            if not site_pool:
-                self._pending_by_site.pop(site_id, None)
-
-        for camera_id, candidate in list(self._pending_by_camera.items()):
-            if now - candidate.ready_at >= self.window:
+        singles: List[AlertAction] = []
+        expiry_heap = self._expiry_heap
+        cooldown_heap = self._cooldown_heap
+        dirty_sites = self._dirty_sites
+        expire = self._expire
+
+        # Anything older than the window can no longer join an aggregate.
+        while expiry_heap and expiry_heap[0][0] < now_s:
+            _, _, site_idx, candidate = heappop(expiry_heap)
+            expire(site_idx, candidate, singles)
+
+        # A site's aggregate can only become due after an enqueue or once its cooldown lapses.
+        while cooldown_heap and cooldown_heap[0][0] <= now_s:
+            dirty_sites.add(heappop(cooldown_heap)[1])
+        if dirty_sites:
+            pending_by_camera = self._pending_by_camera
+            pending_by_site = self._pending_by_site
+            site_cooldown = self._site_cooldown
+            min_count = self.min_count
+            cooldown_until = now_s + self.suppress_s
+            for site_idx in dirty_sites:
+                site_pool = pending_by_site[site_idx]
+                if len(site_pool) < min_count or now_s < site_cooldown[site_idx]:
+                    continue
+                active = list(site_pool)
+                site_pool.clear()
                 dispatches.append(
-                    AlertAction(kind="single", candidates=[candidate], site_id=candidate.site_id)
+                    AlertAction(
+                        kind="aggregate",
+                        candidates=active,
+                        site_id=self._site_ids[site_idx],
+                        washdown_hint=self._within_washdown(active),
+                    )
                 )
-                self._pending_by_camera.pop(camera_id, None)
-                site_pool = self._pending_by_site.get(candidate.site_id)
-                if site_pool is not None:
-                    site_pool.pop(camera_id, None)
-                    if not site_pool:
-                        self._pending_by_site.pop(candidate.site_id, None)
+                for cand in active:
+                    del pending_by_camera[cand.camera_id]
+                site_cooldown[site_idx] = cooldown_until
+                heappush(cooldown_heap, (cooldown_until, site_idx))
+            dirty_sites.clear()
+
+        while expiry_heap and expiry_heap[0][0] <= now_s:
+            _, _, site_idx, candidate = heappop(expiry_heap)
+            expire(site_idx, candidate, singles)
 
+        dispatches.extend(singles)
         return dispatches
 
+    def _expire(self, site_idx: int, candidate: AlertCandidate, singles: List[AlertAction]) -> None:
+        if self._pending_by_camera.get(candidate.camera_id) is not candidate:
+            return
+        del self._pending_by_camera[candidate.camera_id]
+        site_pool = self._pending_by_site[site_idx]
+        if site_pool[0] is candidate:
+            site_pool.popleft()
+        else:
+            site_pool.remove(candidate)
+        singles.append(AlertAction(kind="single", candidates=[candidate], site_id=candidate.site_id))
+
     def _within_washdown(self, candidates: List[AlertCandidate]) -> bool:
-        if not self.washdown_schedule:
+        starts = self._washdown_starts
+        if not starts:
             return False
+        ends = self._washdown_ends
         for cand in candidates:
-            local_time = cand.ready_at.astimezone().time()
-            for start, end in self.washdown_schedule:
-                if start <= end:
-                    if start <= local_time <= end:
-                        return True
-                else:
-                    if local_time >= start or local_time <= end:
-                        return True
+            local = time.localtime(cand.ready_at_s)
+            sec = local.tm_hour * 3600 + local.tm_min * 60 + local.tm_sec
+            idx = bisect_right(starts, sec) - 1
+            if idx >= 0 and sec <= ends[idx]:
+                return True
         return False
 
 
@@ -263,9 +515,17 @@ class AlertEngine:
         self.site_lookup = site_lookup
         self.simulator = simulator
         self.episode_store = episode_store
-        self.threshold = timedelta(seconds=max(0, threshold_sec))
         self.suppress = timedelta(seconds=max(1, suppress_sec))
-        self.state: Dict[str, CameraAlertState] = {}
+        self.threshold_s = float(max(0, threshold_sec))
+        self.suppress_s = float(max(1, suppress_sec))
+        self.state: Dict[str, CameraAlertState] = {cid: CameraAlertState() for cid in line_lookup}
+        self._camera_labels: Dict[str, str] = {cid: _camera_label(cid) for cid in line_lookup}
+        self._line_displays: Dict[str, str] = {cid: _line_display(line) for cid, line in line_lookup.items()}
+        # Each open dialog keeps the blur_start of every camera it covers, so a decision
+        # that arrives after the camera cleared or started a new episode is dropped.
+        # Keyed by a per-dialog token: the same camera can have more than one dialog open.
+        self.pending_decisions: Dict[int, Tuple[Tuple[str, ...], Tuple[datetime, ...], "Future[Tuple[str, datetime]]"]] = {}
+        self._dialog_seq = count()
         self.aggregator = SiteAlertAggregator(
             window_sec=aggregate_window_sec,
             min_count=aggregate_min,
@@ -274,78 +534,139 @@ class AlertEngine:
         )
 
     def process(self, now: datetime, camera_id: str, is_blurry: bool) -> None:
-        st = self.state.setdefault(camera_id, CameraAlertState())
-        if is_blurry:
-            if not st.is_blurry:
-                st.is_blurry = True
-                st.blur_start = now
-            allow_realert = True
-            if st.alert_open and st.last_alert_until and now < st.last_alert_until:
-                allow_realert = False
-            if st.blur_start and allow_realert and not st.pending_candidate:
-                if now - st.blur_start >= self.threshold:
-                    candidate = AlertCandidate(
+        self.process_tick(now, {camera_id: is_blurry})
+
+    def process_tick(self, now: datetime, states: Mapping[str, bool], now_s: Optional[float] = None) -> None:
+        if now_s is None:
+            now_s = now.timestamp()
+        state = self.state
+        threshold_s = self.threshold_s
+        enqueue = self.aggregator.enqueue
+        cancel = self.aggregator.cancel
+        for camera_id, is_blurry in states.items():
+            st = state.get(camera_id)
+            if st is None:
+                st = state[camera_id] = CameraAlertState()
+            if is_blurry:
+                if not st.is_blurry:
+                    st.is_blurry = True
+                    st.blur_start = now
+                    st.blur_start_s = now_s
+                # Steady states (already queued, under threshold, or suppressed) fall through cheaply.
+                if st.pending_candidate or st.blur_start_s is None or now_s - st.blur_start_s < threshold_s:
+                    continue
+                if st.alert_open and st.last_alert_until_s is not None and now_s < st.last_alert_until_s:
+                    continue
+                enqueue(
+                    AlertCandidate(
                         camera_id=camera_id,
                         line_number=self.line_lookup.get(camera_id),
                         blur_since=st.blur_start,
                         ready_at=now,
                         site_id=self.site_lookup.get(camera_id, DEFAULT_SITE_ID),
+                        camera_label=self._camera_labels.get(camera_id, ""),
+                        line_display=self._line_displays.get(camera_id, ""),
+                        blur_since_s=st.blur_start_s,
+                        ready_at_s=now_s,
                     )
-                    self.aggregator.enqueue(candidate)
-                    st.pending_candidate = True
-        else:
-            if st.pending_candidate:
-                self.aggregator.cancel(camera_id)
-                st.pending_candidate = False
-            if st.is_blurry:
-                if st.alert_open:
-                    self._resolve(now, camera_id, st)
-                st.is_blurry = False
-                st.blur_start = None
-                st.alert_open = False
-                st.last_alert_until = None
-
-    def flush(self, now: datetime) -> None:
-        for action in self.aggregator.process(now):
+                )
+                st.pending_candidate = True
+            elif st.is_blurry or st.pending_candidate:
+                if st.pending_candidate:
+                    cancel(camera_id)
+                    st.pending_candidate = False
+                if st.is_blurry:
+                    if st.alert_open:
+                        self._resolve(now, now_s, camera_id, st)
+                    st.is_blurry = False
+                    st.blur_start = None
+                    st.blur_start_s = None
+                    st.alert_open = False
+                    st.last_alert_until = None
+                    st.last_alert_until_s = None
+
+    def flush(self, now: datetime, now_s: Optional[float] = None) -> None:
+        if now_s is None:
+            now_s = now.timestamp()
+        for action in self.aggregator.process(now, now_s):
             if action.kind == "aggregate":
                 self._handle_aggregate(action, now)
             else:
-                self._handle_single(action, now)
+                self._handle_single(action, now, now_s)
 
-    def _handle_single(self, action: AlertAction, now: datetime) -> None:
+    # Notifiers that provide alert_*_async (GuiNotifier does) get a non-blocking dialog whose
+    # decision is applied later by poll_decisions(). Notifiers with only the blocking
+    # alert_single/alert_aggregate are asked synchronously and the decision is applied at once.
+    def _handle_single(self, action: AlertAction, now: datetime, now_s: float) -> None:
         candidate = action.candidates[0]
-        st = self.state.get(candidate.camera_id)
-        if not st:
+        if candidate.camera_id not in self.state:
             return
-        mins = max(1, math.floor((now - candidate.blur_since).total_seconds() / 60))
+        elapsed = int(now_s - candidate.blur_since_s)
+        mins = 1 if elapsed < 60 else elapsed // 60
         print(
             f"[ALERT] Camera {candidate.camera_id}: blurry for {mins} min. Action: wipe lens. ({now.isoformat()})"
         )
-        camera_label = candidate.camera_id.split("-")[-1] if "-" in candidate.camera_id else candidate.camera_id
+        alert_async = getattr(self.notifier, "alert_single_async", None)
+        if alert_async is not None:
+            future = alert_async(
+                camera_label=candidate.camera_label,
+                line_number=candidate.line_number,
+                blur_since=candidate.blur_since,
+            )
+            self.pending_decisions[next(self._dialog_seq)] = ((candidate.camera_id,), (candidate.blur_since,), future)
+            return
         decision = self.notifier.alert_single(
-            camera_label=camera_label,
+            camera_label=candidate.camera_label,
             line_number=candidate.line_number,
             blur_since=candidate.blur_since,
         )
-        self._after_alert(now, [candidate.camera_id], decision)
+        self._after_alert(now, [candidate.camera_id], decision, [candidate.blur_since])
 
     def _handle_aggregate(self, action: AlertAction, now: datetime) -> None:
         camera_ids = [cand.camera_id for cand in action.candidates]
+        blur_since = [cand.blur_since for cand in action.candidates]
         lens_list = ", ".join(camera_ids)
         print(
             f"[ALERT][AGG] Site {action.site_id}: {len(action.candidates)} cameras blurry ({lens_list}). ({now.isoformat()})"
         )
+        alert_async = getattr(self.notifier, "alert_aggregate_async", None)
+        if alert_async is not None:
+            future = alert_async(
+                site_id=action.site_id,
+                candidates=action.candidates,
+                washdown_hint=action.washdown_hint,
+            )
+            self.pending_decisions[next(self._dialog_seq)] = (tuple(camera_ids), tuple(blur_since), future)
+            return
         decision = self.notifier.alert_aggregate(
             site_id=action.site_id,
             candidates=action.candidates,
             washdown_hint=action.washdown_hint,
         )
-        self._after_alert(now, camera_ids, decision)
+        self._after_alert(now, camera_ids, decision, blur_since)
 
-    def _after_alert(self, now: datetime, camera_ids: List[str], decision: str) -> None:
-        for camera_id in camera_ids:
+    def poll_decisions(self) -> None:
+        if not self.pending_decisions:
+            return
+        done = [token for token, (_, _, future) in self.pending_decisions.items() if future.done()]
+        for token in done:
+            camera_ids, blur_since, future = self.pending_decisions.pop(token)
+            decision, decided_at = future.result()
+            self._after_alert(decided_at, camera_ids, decision, blur_since)
+
+    def _after_alert(
+        self,
+        now: datetime,
+        camera_ids: Sequence[str],
+        decision: str,
+        blur_since: Optional[Sequence[datetime]] = None,
+    ) -> None:
+        now_s = now.timestamp()
+        for i, camera_id in enumerate(camera_ids):
             st = self.state.get(camera_id)
-            if not st:
+            if st is None:
+                continue
+            if blur_since is not None and st.blur_start != blur_since[i]:
                 continue
             st.pending_candidate = False
             if decision == "clean":
@@ -353,18 +674,21 @@ class AlertEngine:
                     self.simulator.set_blurry(camera_id, False)
                 if st.blur_start:
                     self.episode_store.append(camera_id, st.blur_start, now)
-                    self._resolve(now, camera_id, st)
+                    self._resolve(now, now_s, camera_id, st)
                 st.is_blurry = False
                 st.blur_start = None
+                st.blur_start_s = None
                 st.alert_open = False
                 st.last_alert_until = None
+                st.last_alert_until_s = None
             else:
                 st.alert_open = True
                 st.last_alert_until = now + self.suppress
+                st.last_alert_until_s = now_s + self.suppress_s
 
-    def _resolve(self, now: datetime, camera_id: str, st: CameraAlertState) -> None:
-        blur_since = st.blur_start or now
-        resolved_minutes = max(0, int((now - blur_since).total_seconds() // 60))
+    def _resolve(self, now: datetime, now_s: float, camera_id: str, st: CameraAlertState) -> None:
+        blur_since_s = st.blur_start_s if st.blur_start_s is not None else now_s
+        resolved_minutes = max(0, int(now_s - blur_since_s) // 60)
         print(f"[RESOLVED] Camera {camera_id}: blur cleared after {resolved_minutes} min. ({now.isoformat()})")
 
 
@@ -386,6 +710,17 @@ def parse_washdown_schedule(spec: Optional[str]) -> List[Tuple[dtime, dtime]]:
     return windows
 
 
+def _idle(interval: int, pump: Optional[Callable[[], None]]) -> None:
+    deadline = time.monotonic() + max(0, interval)
+    while True:
+        if pump is not None:
+            pump()
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, 0.05))
+
+
 def run(
     cameras: int,
     interval: int,
@@ -402,7 +737,7 @@ def run(
     simulator: Optional[Simulator] = None,
     notifier: Optional[GuiNotifier] = None,
 ):
-    camera_ids = [f"CAM-{i+1:02d}" for i in range(cameras)]
+    camera_ids = [sys.intern(f"CAM-{i+1:02d}") for i in range(cameras)]
     store = CsvStore(csv_path)
     episode_store = BlurEpisodeStore(episodes_csv)
     sim = simulator if simulator is not None else Simulator(camera_ids)
@@ -428,6 +763,7 @@ def run(
     )
     stop = False
     ticks = 0
+    pump = getattr(notifier_obj, "pump", None)
 
     def handle_sigint(signum, frame):
         nonlocal stop
@@ -436,17 +772,24 @@ def run(
 
     signal.signal(signal.SIGINT, handle_sigint)
 
-    while not stop:
-        now = datetime.now(timezone.utc)
-        states = sim.tick()
-        for cid, is_blur in states.items():
-            store.append(Event(ts=now, camera_id=cid, is_blurry=is_blur))
-            engine.process(now=now, camera_id=cid, is_blurry=is_blur)
-        engine.flush(now)
-        ticks += 1
-        if max_ticks is not None and ticks >= max_ticks:
-            break
-        time.sleep(max(0, interval))
+    try:
+        while not stop:
+            now = datetime.now(timezone.utc)
+            now_s = now.timestamp()
+            engine.poll_decisions()
+            states = sim.tick()
+            store.append_many(now.isoformat(), states)
+            engine.process_tick(now, states, now_s)
+            engine.flush(now, now_s)
+            ticks += 1
+            if max_ticks is not None and ticks >= max_ticks:
+                break
+            _idle(interval, pump)
+    finally:
+        try:
+            store.close()
+        finally:
+            episode_store.close()
 
 
 def main():
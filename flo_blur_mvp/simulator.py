@@ -1,5 +1,6 @@
 import random
-from typing import Dict, Iterable
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping
 
 
 class Simulator:
@@ -10,21 +11,29 @@ class Simulator:
         p_blur_off: float = 0.20,
         auto_clear: bool = False,
     ):
-        self.state: Dict[str, bool] = {cid: False for cid in camera_ids}
+        self._ids: List[str] = list(camera_ids)
+        self._idx: Dict[str, int] = {cid: i for i, cid in enumerate(self._ids)}
+        self._state: List[bool] = [False] * len(self._ids)
         self.p_blur_on = p_blur_on
         self.p_blur_off = p_blur_off
         self.auto_clear = auto_clear
 
+    @property
+    def state(self) -> Mapping[str, bool]:
+        # Read-only snapshot; use set_blurry() to change a camera.
+        return MappingProxyType(dict(zip(self._ids, self._state)))
+
     def tick(self) -> Dict[str, bool]:
-        for cid in list(self.state.keys()):
-            if not self.state[cid]:
-                if random.random() < self.p_blur_on:
-                    self.state[cid] = True
-            else:
-                if self.auto_clear and random.random() < self.p_blur_off:
-                    self.state[cid] = False
-        return self.state.copy()
+        rand = random.random
+        p_on = self.p_blur_on
+        if self.auto_clear:
+            p_off = self.p_blur_off
+            self._state = [rand() >= p_off if on else rand() < p_on for on in self._state]
+        else:
+            self._state = [on or rand() < p_on for on in self._state]
+        return dict(zip(self._ids, self._state))
 
     def set_blurry(self, camera_id: str, is_blurry: bool) -> None:
-        if camera_id in self.state:
-            self.state[camera_id] = is_blurry
+        idx = self._idx.get(camera_id)
+        if idx is not None:
+            self._state[idx] = is_blurry
@@ -1,4 +1,5 @@
 import csv
+from concurrent.futures import Future
 from datetime import datetime, timedelta, timezone
 
 from blurry_mvp import AlertEngine, BlurEpisodeStore, CameraAlertState
@@ -12,6 +13,19 @@ class StubNotifier:
         return "ignore"
 
 
+class AsyncStubNotifier:
+    def __init__(self):
+        self.futures = []
+
+    def alert_single_async(self, *args, **kwargs):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+    def alert_aggregate_async(self, *args, **kwargs):
+        return self.alert_single_async()
+
+
 class StubSimulator:
     def __init__(self):
         self.calls = []
@@ -40,16 +54,16 @@ def build_engine(tmp_path):
     return engine, simulator, episodes_path
 
 
-def test_after_alert_logs_episode_on_clean(tmp_path):
+def test_after_alert_logs_episode_on_clean(tmp_path, capsys):
     engine, simulator, episodes_path = build_engine(tmp_path)
     blur_start = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
     resolved_at = blur_start + timedelta(minutes=4)
-    state = engine.state.setdefault(
-        "CAM-01",
-        CameraAlertState(is_blurry=True, blur_start=blur_start, alert_open=True, pending_candidate=True),
+    state = engine.state["CAM-01"] = CameraAlertState(
+        is_blurry=True, blur_start=blur_start, alert_open=True, pending_candidate=True
     )
 
     engine._after_alert(resolved_at, ["CAM-01"], "clean")
+    engine.episode_store.close()
 
     with episodes_path.open(newline="") as f:
         rows = list(csv.reader(f))
@@ -57,8 +71,10 @@ def test_after_alert_logs_episode_on_clean(tmp_path):
     assert rows[0] == ["camera_id", "blur_start_iso", "cleared_iso"]
     assert rows[1] == ["CAM-01", blur_start.isoformat(), resolved_at.isoformat()]
     assert simulator.calls == [("CAM-01", False)]
+    assert "[RESOLVED] Camera CAM-01: blur cleared after 4 min." in capsys.readouterr().out
     assert state.is_blurry is False
     assert state.blur_start is None
+    assert state.blur_start_s is None
     assert state.alert_open is False
     assert state.last_alert_until is None
     assert state.pending_candidate is False
@@ -68,15 +84,17 @@ def test_after_alert_sets_cooldown_on_ignore(tmp_path):
     engine, simulator, episodes_path = build_engine(tmp_path)
     blur_start = datetime(2025, 1, 1, 8, 0, tzinfo=timezone.utc)
     now = blur_start + timedelta(minutes=1)
-    state = engine.state.setdefault(
-        "CAM-01",
-        CameraAlertState(is_blurry=True, blur_start=blur_start, alert_open=False, pending_candidate=True),
+    state = engine.state["CAM-01"] = CameraAlertState(
+        is_blurry=True, blur_start=blur_start, alert_open=False, pending_candidate=True
     )
 
     engine._after_alert(now, ["CAM-01"], "ignore")
+    engine.episode_store.close()
 
     assert state.alert_open is True
     assert state.last_alert_until == now + engine.suppress
+    assert state.last_alert_until_s == (now + engine.suppress).timestamp()
+    assert state.blur_start_s == blur_start.timestamp()
     assert state.is_blurry is True
     assert state.blur_start == blur_start
     assert state.pending_candidate is False
@@ -86,3 +104,156 @@ def test_after_alert_sets_cooldown_on_ignore(tmp_path):
         rows = list(csv.reader(f))
 
     assert rows == [["camera_id", "blur_start_iso", "cleared_iso"]]
+
+
+def test_process_tick_enqueues_candidates_past_threshold(tmp_path):
+    engine, simulator, episodes_path = build_engine(tmp_path)
+    start = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+    engine.process_tick(start, {"CAM-01": True, "CAM-02": False})
+    assert engine.aggregator.process(start) == []
+
+    later = start + timedelta(seconds=2)
+    engine.process_tick(later, {"CAM-01": True, "CAM-02": False})
+    actions = engine.aggregator.process(later)
+    engine.episode_store.close()
+
+    assert [(a.kind, a.candidates[0].camera_id) for a in actions] == [("aggregate", "CAM-01")]
+    assert actions[0].candidates[0].blur_since == start
+    assert (actions[0].candidates[0].camera_label, actions[0].candidates[0].line_display) == ("01", "1")
+    assert engine.state["CAM-01"].pending_candidate is True
+    assert engine.state["CAM-02"].is_blurry is False
+
+
+def test_async_decision_is_applied_when_polled(tmp_path):
+    engine, simulator, episodes_path = build_engine(tmp_path)
+    engine.notifier = AsyncStubNotifier()
+    start = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    later = start + timedelta(seconds=2)
+
+    engine.process_tick(start, {"CAM-01": True})
+    engine.process_tick(later, {"CAM-01": True})
+    engine.flush(later)
+
+    assert [camera_ids for camera_ids, _, _ in engine.pending_decisions.values()] == [("CAM-01",)]
+    engine.poll_decisions()
+    assert engine.state["CAM-01"].pending_candidate is True
+
+    cleaned_at = later + timedelta(minutes=1)
+    engine.notifier.futures[0].set_result(("clean", cleaned_at))
+    engine.poll_decisions()
+    engine.episode_store.close()
+
+    assert engine.pending_decisions == {}
+    assert engine.state["CAM-01"].is_blurry is False
+    assert simulator.calls == [("CAM-01", False)]
+    with episodes_path.open(newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[1] == ["CAM-01", start.isoformat(), cleaned_at.isoformat()]
+
+
+def test_ignored_camera_is_not_requeued_until_suppression_ends(tmp_path):
+    engine, simulator, episodes_path = build_engine(tmp_path)
+    start = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    engine.process_tick(start, {"CAM-01": True})
+    alerted_at = start + timedelta(seconds=2)
+    engine.process_tick(alerted_at, {"CAM-01": True})
+    engine.flush(alerted_at)
+    engine.episode_store.close()
+    state = engine.state["CAM-01"]
+    assert state.alert_open is True and state.pending_candidate is False
+
+    engine.process_tick(alerted_at + timedelta(seconds=29), {"CAM-01": True})
+    assert state.pending_candidate is False
+
+    engine.process_tick(alerted_at + timedelta(seconds=30), {"CAM-01": True})
+    assert state.pending_candidate is True
+
+
+def test_stale_decision_is_dropped_after_camera_reblurs(tmp_path):
+    engine, simulator, episodes_path = build_engine(tmp_path)
+    engine.notifier = AsyncStubNotifier()
+    start = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    engine.process_tick(start, {"CAM-01": True})
+    engine.process_tick(start + timedelta(seconds=2), {"CAM-01": True})
+    engine.flush(start + timedelta(seconds=2))
+    old_dialog = engine.notifier.futures[0]
+
+    engine.process_tick(start + timedelta(seconds=5), {"CAM-01": False})
+    engine.process_tick(start + timedelta(seconds=10), {"CAM-01": True})
+    engine.process_tick(start + timedelta(seconds=12), {"CAM-01": True})
+    state = engine.state["CAM-01"]
+    assert state.pending_candidate is True
+
+    old_dialog.set_result(("clean", start + timedelta(seconds=13)))
+    engine.poll_decisions()
+    engine.episode_store.close()
+
+    assert state.pending_candidate is True
+    assert state.blur_start == start + timedelta(seconds=10)
+    assert simulator.calls == []
+    with episodes_path.open(newline="") as f:
+        assert list(csv.reader(f)) == [["camera_id", "blur_start_iso", "cleared_iso"]]
+
+
+def test_stale_ignore_does_not_suppress_cleared_camera(tmp_path):
+    engine, simulator, episodes_path = build_engine(tmp_path)
+    engine.notifier = AsyncStubNotifier()
+    start = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    engine.process_tick(start, {"CAM-01": True})
+    engine.process_tick(start + timedelta(seconds=2), {"CAM-01": True})
+    engine.flush(start + timedelta(seconds=2))
+    engine.process_tick(start + timedelta(seconds=5), {"CAM-01": False})
+
+    engine.notifier.futures[0].set_result(("ignore", start + timedelta(seconds=6)))
+    engine.poll_decisions()
+    engine.episode_store.close()
+
+    state = engine.state["CAM-01"]
+    assert state.alert_open is False
+    assert state.last_alert_until is None
+
+
+def test_each_open_dialog_for_a_camera_is_tracked(tmp_path):
+    engine, simulator, episodes_path = build_engine(tmp_path)
+    engine.notifier = AsyncStubNotifier()
+    start = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    engine.process_tick(start, {"CAM-01": True})
+    engine.process_tick(start + timedelta(seconds=2), {"CAM-01": True})
+    engine.flush(start + timedelta(seconds=2))
+    engine.process_tick(start + timedelta(seconds=5), {"CAM-01": False})
+    reblur = start + timedelta(seconds=10)
+    engine.process_tick(reblur, {"CAM-01": True})
+    engine.process_tick(reblur + timedelta(seconds=2), {"CAM-01": True})
+    engine.flush(reblur + timedelta(seconds=2))
+
+    assert len(engine.pending_decisions) == 2
+    first, second = engine.notifier.futures
+    cleaned_at = reblur + timedelta(seconds=3)
+    first.set_result(("ignore", cleaned_at))
+    second.set_result(("clean", cleaned_at))
+    engine.poll_decisions()
+    engine.episode_store.close()
+
+    assert engine.pending_decisions == {}
+    state = engine.state["CAM-01"]
+    assert state.is_blurry is False and state.alert_open is False
+    with episodes_path.open(newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[1:] == [["CAM-01", reblur.isoformat(), cleaned_at.isoformat()]]
+
+
+def test_candidate_carries_the_engine_epoch_seconds(tmp_path):
+    engine, simulator, episodes_path = build_engine(tmp_path)
+    start = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    start_s = start.timestamp() + 0.0000004
+    later = start + timedelta(seconds=2)
+    later_s = later.timestamp() + 0.0000004
+
+    engine.process_tick(start, {"CAM-01": True}, start_s)
+    engine.process_tick(later, {"CAM-01": True}, later_s)
+    candidate = engine.aggregator.process(later, later_s)[0].candidates[0]
+    engine.episode_store.close()
+
+    assert candidate.blur_since_s == start_s == engine.state["CAM-01"].blur_start_s
+    assert candidate.ready_at_s == later_s
@@ -1,4 +1,5 @@
 import csv
+from concurrent.futures import Future
 from datetime import datetime, timezone
 
 import blurry_mvp
@@ -10,14 +11,17 @@ class SequenceSimulator:
         self.states = [dict(state) for state in states]
         self.index = 0
         self.current_state = {cid: False for cid in camera_ids}
+        self.log = []
 
     def tick(self):
+        self.log.append("tick")
         if self.index < len(self.states):
             self.current_state.update(self.states[self.index])
         self.index += 1
         return dict(self.current_state)
 
     def set_blurry(self, camera_id: str, is_blurry: bool) -> None:
+        self.log.append(("set_blurry", camera_id, is_blurry))
         self.current_state[camera_id] = is_blurry
 
 
@@ -35,6 +39,69 @@ class DeterministicNotifier:
         return self.decisions.pop(0)
 
 
+class AsyncPumpNotifier:
+    def __init__(self, decision):
+        self.decision = decision
+        self.open_dialogs = []
+        self.decided_at = []
+
+    def _post(self):
+        future = Future()
+        self.open_dialogs.append(future)
+        return future
+
+    def alert_single_async(self, *, camera_label, line_number, blur_since):
+        return self._post()
+
+    def alert_aggregate_async(self, *, site_id, candidates, washdown_hint=False):
+        return self._post()
+
+    def pump(self):
+        while self.open_dialogs:
+            decided_at = datetime.now(timezone.utc)
+            self.decided_at.append(decided_at)
+            self.open_dialogs.pop(0).set_result((self.decision, decided_at))
+
+
+def test_run_applies_async_decision_before_next_tick(tmp_path, monkeypatch):
+    event_path = tmp_path / "events.csv"
+    episode_path = tmp_path / "episodes.csv"
+
+    simulator = SequenceSimulator(["CAM-01"], [{"CAM-01": True}])
+    notifier = AsyncPumpNotifier("clean")
+
+    monkeypatch.setattr(blurry_mvp.signal, "signal", lambda *args, **kwargs: None)
+    monkeypatch.setattr(blurry_mvp.time, "sleep", lambda *args, **kwargs: None)
+
+    blurry_mvp.run(
+        cameras=1,
+        interval=0,
+        csv_path=str(event_path),
+        episodes_csv=str(episode_path),
+        alert_threshold=0,
+        suppress_seconds=1,
+        site_id="SiteA",
+        aggregate_window=0,
+        aggregate_min=1,
+        aggregate_suppress=5,
+        washdown_schedule=[],
+        max_ticks=2,
+        simulator=simulator,
+        notifier=notifier,
+    )
+
+    assert simulator.log == ["tick", ("set_blurry", "CAM-01", False), "tick"]
+
+    with event_path.open(newline="") as f:
+        events = list(csv.reader(f))
+    assert [row[1:] for row in events[1:]] == [["CAM-01", "1"], ["CAM-01", "0"]]
+
+    with episode_path.open(newline="") as f:
+        episodes = list(csv.reader(f))
+    assert episodes[1][0] == "CAM-01"
+    assert episodes[1][2] == notifier.decided_at[0].isoformat()
+
+
 def test_run_writes_event_and_episode_csv(tmp_path, monkeypatch):
     event_path = tmp_path / "events.csv"
     episode_path = tmp_path / "episodes.csv"
@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta, timezone
+
+from blurry_mvp import AlertCandidate, GuiNotifier
+
+
+def build_notifier(messages):
+    notifier = GuiNotifier.__new__(GuiNotifier)
+    notifier._show_dialog = lambda message, clean_label: messages.append(message) or "ignore"
+    return notifier
+
+
+def test_alert_aggregate_lists_each_camera():
+    messages = []
+    notifier = build_notifier(messages)
+    since = datetime(2025, 1, 1, 9, 15, 20, tzinfo=timezone.utc)
+    candidates = [
+        AlertCandidate("CAM-01", 1, since, since + timedelta(minutes=1), "SiteA"),
+        AlertCandidate("CAM-02", None, since + timedelta(seconds=30), since + timedelta(minutes=1), "SiteA"),
+    ]
+
+    notifier.alert_aggregate(site_id="SiteA", candidates=candidates, washdown_hint=True)
+
+    time_label = since.astimezone().strftime("%I:%M %p")
+    assert messages == [
+        "FloVision Alert (Site SiteA):\n"
+        " 2 cameras blurry.\n"
+        f" • Camera #01 (Line 1) blurry since {time_label}.\n"
+        f" • Camera #02 (Line ?) blurry since {time_label}.\n"
+        "Action: Please wipe lenses.\n"
+        "(Likely washdown window.)"
+    ]
+
+
+def test_async_dialog_resolves_with_decision_and_click_time():
+    callbacks = []
+    notifier = GuiNotifier.__new__(GuiNotifier)
+    notifier._build_dialog = lambda message, clean_label, on_result: callbacks.append(on_result)
+    since = datetime(2025, 1, 1, 9, 15, tzinfo=timezone.utc)
+
+    future = notifier.alert_single_async(camera_label="01", line_number=1, blur_since=since)
+    assert not future.done()
+
+    before = datetime.now(timezone.utc)
+    callbacks[0]("clean")
+    decision, decided_at = future.result()
+
+    assert decision == "clean"
+    assert before <= decided_at <= datetime.now(timezone.utc)
@@ -0,0 +1,27 @@
+import pytest
+
+from simulator import Simulator
+
+
+def test_tick_turns_cameras_on_and_keeps_them_without_auto_clear():
+    sim = Simulator(["CAM-01", "CAM-02"], p_blur_on=1.0, p_blur_off=1.0)
+
+    assert sim.tick() == {"CAM-01": True, "CAM-02": True}
+    assert sim.tick() == {"CAM-01": True, "CAM-02": True}
+
+
+def test_tick_auto_clear_and_set_blurry():
+    sim = Simulator(["CAM-01", "CAM-02"], p_blur_on=0.0, p_blur_off=1.0, auto_clear=True)
+    sim.set_blurry("CAM-02", True)
+    sim.set_blurry("CAM-99", True)
+
+    assert sim.state == {"CAM-01": False, "CAM-02": True}
+    assert sim.tick() == {"CAM-01": False, "CAM-02": False}
+
+
+def test_state_snapshot_rejects_writes():
+    sim = Simulator(["CAM-01"])
+
+    with pytest.raises(TypeError):
+        sim.state["CAM-01"] = True
+    assert sim.state == {"CAM-01": False}
@@ -31,6 +31,20 @@ def test_aggregator_dispatches_when_minimum_met():
     assert action.washdown_hint is False
 
 
+def test_aggregator_counts_sites_independently():
+    now = datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)
+    aggregator = SiteAlertAggregator(window_sec=30, min_count=2, suppress_sec=90)
+    aggregator.enqueue(make_candidate("CAM-01", ready_at=now, site_id="SiteA"))
+    aggregator.enqueue(make_candidate("CAM-02", ready_at=now, site_id="SiteB"))
+    aggregator.enqueue(make_candidate("CAM-03", ready_at=now, site_id="SiteB"))
+
+    actions = aggregator.process(now)
+    assert [(a.kind, a.site_id) for a in actions] == [("aggregate", "SiteB")]
+
+    actions = aggregator.process(now + timedelta(seconds=30))
+    assert [(a.kind, a.site_id, a.candidates[0].camera_id) for a in actions] == [("single", "SiteA", "CAM-01")]
+
+
 def test_aggregator_suppresses_repeated_aggregate_until_cooldown_expires():
     start = datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc)
     aggregator = SiteAlertAggregator(window_sec=30, min_count=2, suppress_sec=120)
@@ -52,6 +66,24 @@ def test_aggregator_suppresses_repeated_aggregate_until_cooldown_expires():
     assert dispatched and dispatched[0].kind == "aggregate"
 
 
+def test_aggregate_held_by_cooldown_dispatches_once_cooldown_lapses():
+    start = datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc)
+    aggregator = SiteAlertAggregator(window_sec=30, min_count=2, suppress_sec=10)
+    aggregator.enqueue(make_candidate("CAM-01", ready_at=start))
+    aggregator.enqueue(make_candidate("CAM-02", ready_at=start))
+    assert aggregator.process(start)[0].kind == "aggregate"
+
+    held = start + timedelta(seconds=5)
+    aggregator.enqueue(make_candidate("CAM-03", ready_at=held))
+    aggregator.enqueue(make_candidate("CAM-04", ready_at=held))
+    assert aggregator.process(held) == []
+    assert aggregator.process(start + timedelta(seconds=9)) == []
+
+    actions = aggregator.process(start + timedelta(seconds=10))
+    assert [a.kind for a in actions] == ["aggregate"]
+    assert {c.camera_id for c in actions[0].candidates} == {"CAM-03", "CAM-04"}
+
+
 def test_single_alert_emitted_when_window_expires():
     now = datetime(2025, 1, 1, 7, 0, tzinfo=timezone.utc)
     aggregator = SiteAlertAggregator(window_sec=10, min_count=3, suppress_sec=60)
@@ -64,6 +96,20 @@ def test_single_alert_emitted_when_window_expires():
     assert actions[0].candidates[0].camera_id == "CAM-99"
 
 
+def test_expired_candidates_are_not_aggregated_with_fresh_ones():
+    start = datetime(2025, 1, 1, 7, 0, tzinfo=timezone.utc)
+    aggregator = SiteAlertAggregator(window_sec=10, min_count=2, suppress_sec=60)
+    aggregator.enqueue(make_candidate("CAM-01", ready_at=start))
+    aggregator.enqueue(make_candidate("CAM-02", ready_at=start + timedelta(seconds=5)))
+    aggregator.cancel("CAM-02")
+    aggregator.enqueue(make_candidate("CAM-03", ready_at=start + timedelta(seconds=12)))
+
+    actions = aggregator.process(start + timedelta(seconds=12))
+
+    assert [(a.kind, a.candidates[0].camera_id) for a in actions] == [("single", "CAM-01")]
+    assert aggregator.process(start + timedelta(seconds=13)) == []
+
+
 def test_washdown_hint_enabled_when_schedule_matches():
     now = datetime(2025, 1, 1, 5, 0, tzinfo=timezone.utc)
     schedule = [(dtime(0, 0), dtime(23, 59))]
@@ -74,3 +120,21 @@ def test_washdown_hint_enabled_when_schedule_matches():
     actions = aggregator.process(now)
 
     assert actions[0].washdown_hint is True
+
+
+def test_washdown_hint_handles_windows_wrapping_midnight():
+    schedule = [(dtime(23, 0), dtime(1, 0)), (dtime(6, 0), dtime(6, 30))]
+    aggregator = SiteAlertAggregator(window_sec=30, min_count=1, suppress_sec=1, washdown_schedule=schedule)
+    expected = {
+        datetime(2025, 1, 1, 23, 30): True,
+        datetime(2025, 1, 2, 0, 45): True,
+        datetime(2025, 1, 2, 6, 30): True,
+        datetime(2025, 1, 2, 6, 31): False,
+        datetime(2025, 1, 2, 12, 0): False,
+    }
+
+    for local_naive, hint in expected.items():
+        ready_at = local_naive.astimezone()
+        aggregator.enqueue(make_candidate("CAM-01", ready_at=ready_at))
+        actions = aggregator.process(ready_at)
+        assert actions[0].washdown_hint is hint, local_naive
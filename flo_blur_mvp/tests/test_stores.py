@@ -1,6 +1,9 @@
 import csv
+import threading
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from blurry_mvp import BlurEpisodeStore, CsvStore, Event
 
 
@@ -9,6 +12,7 @@ def test_csv_store_appends_with_header(tmp_path):
     store = CsvStore(str(path))
     ts = datetime(2025, 1, 1, 6, 0, tzinfo=timezone.utc)
     store.append(Event(ts=ts, camera_id="CAM-01", is_blurry=True))
+    store.close()
 
     with path.open(newline="") as f:
         rows = list(csv.reader(f))
@@ -17,6 +21,38 @@ def test_csv_store_appends_with_header(tmp_path):
     assert rows[1] == [ts.isoformat(), "CAM-01", "1"]
 
 
+def test_csv_store_append_many_shares_timestamp(tmp_path):
+    path = tmp_path / "events.csv"
+    store = CsvStore(str(path))
+    ts = datetime(2025, 1, 1, 6, 0, tzinfo=timezone.utc)
+    store.append_many(ts.isoformat(), {"CAM-01": True, "CAM-02": False})
+    store.close()
+
+    with path.open(newline="") as f:
+        rows = list(csv.reader(f))
+
+    assert rows[1:] == [[ts.isoformat(), "CAM-01", "1"], [ts.isoformat(), "CAM-02", "0"]]
+
+
+def test_csv_store_rows_match_csv_writer_format(tmp_path):
+    path = tmp_path / "events.csv"
+    store = CsvStore(str(path))
+    ts = datetime(2025, 1, 1, 6, 0, tzinfo=timezone.utc)
+    store.append(Event(ts=ts, camera_id="CAM-01", is_blurry=True), ts_iso="precomputed")
+    store.close()
+
+    assert path.read_bytes() == b"ts_iso,camera_id,is_blurry\r\nprecomputed,CAM-01,1\r\n"
+
+
+def test_csv_store_writes_header_into_existing_empty_file(tmp_path):
+    path = tmp_path / "events.csv"
+    path.write_text("")
+    store = CsvStore(str(path))
+    store.close()
+
+    assert path.read_bytes() == b"ts_iso,camera_id,is_blurry\r\n"
+
+
 def test_blur_episode_store_records_interval(tmp_path):
     path = tmp_path / "episodes.csv"
     store = BlurEpisodeStore(str(path))
@@ -24,9 +60,96 @@ def test_blur_episode_store_records_interval(tmp_path):
     end = start + timedelta(minutes=2)
 
     store.append("CAM-07", start, end)
+    store.close()
 
     with path.open(newline="") as f:
         rows = list(csv.reader(f))
 
     assert rows[0] == ["camera_id", "blur_start_iso", "cleared_iso"]
     assert rows[1] == ["CAM-07", start.isoformat(), end.isoformat()]
+
+
+def test_csv_store_flush_waits_for_writer(tmp_path):
+    path = tmp_path / "events.csv"
+    store = CsvStore(str(path), batch_size=2)
+    ts = datetime(2025, 1, 1, 6, 0, tzinfo=timezone.utc)
+    for i in range(5):
+        store.append(Event(ts=ts, camera_id=f"CAM-{i:02d}", is_blurry=False))
+
+    store.flush()
+    with path.open(newline="") as f:
+        rows = list(csv.reader(f))
+    store.close()
+    store.close()
+
+    assert [row[1] for row in rows[1:]] == [f"CAM-{i:02d}" for i in range(5)]
+
+
+def test_csv_store_reopen_does_not_repeat_header(tmp_path):
+    path = tmp_path / "events.csv"
+    ts = datetime(2025, 1, 1, 6, 0, tzinfo=timezone.utc)
+    for cam in ("CAM-01", "CAM-02"):
+        store = CsvStore(str(path))
+        store.append(Event(ts=ts, camera_id=cam, is_blurry=True))
+        store.close()
+
+    with path.open(newline="") as f:
+        rows = list(csv.reader(f))
+
+    assert rows == [
+        ["ts_iso", "camera_id", "is_blurry"],
+        [ts.isoformat(), "CAM-01", "1"],
+        [ts.isoformat(), "CAM-02", "1"],
+    ]
+
+
+class FailingFile:
+    def __init__(self, real):
+        self.real = real
+
+    def write(self, data):
+        raise OSError("disk full")
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.real.close()
+
+
+def test_csv_store_reports_writer_failure_without_blocking(tmp_path):
+    path = tmp_path / "events.csv"
+    store = CsvStore(str(path), max_pending=1)
+    store._f = FailingFile(store._f)
+    ts = datetime(2025, 1, 1, 6, 0, tzinfo=timezone.utc)
+
+    def produce():
+        store.append(Event(ts=ts, camera_id="CAM-01", is_blurry=True))
+        with pytest.raises(OSError, match="disk full"):
+            store.flush()
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    producer.join(timeout=5)
+    assert not producer.is_alive()
+
+    with pytest.raises(OSError, match="disk full"):
+        store.append_many(ts.isoformat(), {"CAM-02": False})
+    with pytest.raises(OSError, match="disk full"):
+        store.close()
+    store.close()
+
+
+def test_csv_store_rejects_appends_after_close(tmp_path):
+    path = tmp_path / "events.csv"
+    store = CsvStore(str(path), max_pending=2)
+    store.close()
+    ts = datetime(2025, 1, 1, 6, 0, tzinfo=timezone.utc)
+
+    for _ in range(3):
+        with pytest.raises(ValueError, match="closed store"):
+            store.append(Event(ts=ts, camera_id="CAM-01", is_blurry=True))
+        with pytest.raises(ValueError, match="closed store"):
+            store.append_many(ts.isoformat(), {"CAM-01": True})
+
+    assert path.read_bytes() == b"ts_iso,camera_id,is_blurry\r\n"